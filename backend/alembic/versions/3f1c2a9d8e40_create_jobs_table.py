@@ -0,0 +1,52 @@
+"""create jobs table
+
+Baseline: the jobs table as ``Base.metadata.create_all`` originally built it.
+Databases created that way should run ``alembic stamp 3f1c2a9d8e40`` before upgrading.
+
+Revision ID: 3f1c2a9d8e40
+Revises:
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a9d8e40"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("job_title", sa.String(), nullable=True),
+        sa.Column("company_name", sa.String(), nullable=True),
+        sa.Column("job_url", sa.String(), nullable=True),
+        sa.Column("job_description", sa.Text(), nullable=True),
+        sa.Column("analysis_results", sa.JSON(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("SAVED", "APPLIED", "INTERVIEWING", "OFFER", "REJECTED", name="applicationstatus"),
+            nullable=True,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_jobs_id", "jobs", ["id"])
+    op.create_index("ix_jobs_job_title", "jobs", ["job_title"])
+    op.create_index("ix_jobs_company_name", "jobs", ["company_name"])
+    op.create_index("ix_jobs_job_url", "jobs", ["job_url"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("jobs")
+    sa.Enum(name="applicationstatus").drop(op.get_bind(), checkfirst=True)
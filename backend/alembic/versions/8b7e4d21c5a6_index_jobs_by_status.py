@@ -0,0 +1,43 @@
+"""index jobs by status
+
+Adds ix_jobs_status_created for the pipeline-tracker view and drops the unused
+job_title / company_name indexes. Built CONCURRENTLY so the jobs table stays writable.
+
+Revision ID: 8b7e4d21c5a6
+Revises: 3f1c2a9d8e40
+Create Date: 2026-10-15 09:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b7e4d21c5a6"
+down_revision: Union[str, Sequence[str], None] = "3f1c2a9d8e40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_status_created",
+            "jobs",
+            ["status", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_jobs_job_title", table_name="jobs", postgresql_concurrently=True)
+        op.drop_index("ix_jobs_company_name", table_name="jobs", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index("ix_jobs_company_name", "jobs", ["company_name"], postgresql_concurrently=True)
+        op.create_index("ix_jobs_job_title", "jobs", ["job_title"], postgresql_concurrently=True)
+        op.drop_index("ix_jobs_status_created", table_name="jobs", postgresql_concurrently=True)
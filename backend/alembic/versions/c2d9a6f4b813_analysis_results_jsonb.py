@@ -0,0 +1,43 @@
+"""store analysis_results as jsonb
+
+Revision ID: c2d9a6f4b813
+Revises: 8b7e4d21c5a6
+Create Date: 2026-10-15 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c2d9a6f4b813"
+down_revision: Union[str, Sequence[str], None] = "8b7e4d21c5a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # JSON null stored by the old column type becomes SQL NULL, matching JSONB(none_as_null=True)
+    op.execute("UPDATE jobs SET analysis_results = NULL WHERE json_typeof(analysis_results) = 'null'")
+    op.alter_column(
+        "jobs",
+        "analysis_results",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        postgresql_using="analysis_results::jsonb",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "jobs",
+        "analysis_results",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        postgresql_using="analysis_results::json",
+    )
@@ -0,0 +1,61 @@
+"""store job status as application_status enum values
+
+Replaces the applicationstatus enum of member names ('SAVED', ...) with
+application_status holding the values ('saved', ...), makes status NOT NULL
+and adds the partial index over jobs still in progress.
+
+Revision ID: e5a1f0b7d392
+Revises: c2d9a6f4b813
+Create Date: 2026-10-15 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a1f0b7d392"
+down_revision: Union[str, Sequence[str], None] = "c2d9a6f4b813"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUS_NAMES = ("SAVED", "APPLIED", "INTERVIEWING", "OFFER", "REJECTED")
+STATUS_VALUES = ("saved", "applied", "interviewing", "offer", "rejected")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    sa.Enum(*STATUS_VALUES, name="application_status").create(op.get_bind())
+    op.execute(
+        "ALTER TABLE jobs ALTER COLUMN status TYPE application_status "
+        "USING LOWER(status::text)::application_status"
+    )
+    op.execute("UPDATE jobs SET status = 'saved' WHERE status IS NULL")
+    op.alter_column("jobs", "status", nullable=False)
+    sa.Enum(name="applicationstatus").drop(op.get_bind())
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_status_active",
+            "jobs",
+            [sa.text("created_at DESC")],
+            postgresql_where=sa.text("status IN ('saved', 'applied', 'interviewing')"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_jobs_status_active", table_name="jobs", postgresql_concurrently=True)
+
+    sa.Enum(*STATUS_NAMES, name="applicationstatus").create(op.get_bind())
+    op.alter_column("jobs", "status", nullable=True)
+    op.execute(
+        "ALTER TABLE jobs ALTER COLUMN status TYPE applicationstatus "
+        "USING UPPER(status::text)::applicationstatus"
+    )
+    sa.Enum(name="application_status").drop(op.get_bind())
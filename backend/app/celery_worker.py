@@ -1,9 +1,12 @@
 from celery import Celery
 
+from app.core.config import REDIS_URL
+
 celery_app = Celery(
     "worker",
-    broker="redis://localhost:6379/0",
-    backend="redis://localhost:6379/0",
+    broker=REDIS_URL,
+    backend=REDIS_URL,
+    include=["app.services.jobs.tasks"],
 )
 
 celery_app.conf.task_routes = {
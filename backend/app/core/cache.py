@@ -0,0 +1,43 @@
+# app/core/cache.py
+import functools
+import hashlib
+import orjson
+import redis
+
+from app.core.config import REDIS_URL
+
+# Shares the Redis instance used as the Celery broker. Both timeouts are short so a
+# stalled Redis degrades to a cache miss instead of blocking the caller
+redis_client = redis.Redis.from_url(REDIS_URL, socket_connect_timeout=1, socket_timeout=1)
+
+
+def redis_cache(prefix: str, ttl: int = 86400):
+    """
+    Caches the JSON-serializable result of a single-string-argument function in Redis,
+    keyed on the SHA-256 of the argument. None results are never cached, and the
+    wrapped function is still called if Redis is unreachable or stops responding.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(value: str):
+            key = f"{prefix}:{hashlib.sha256(value.encode()).hexdigest()}"
+
+            try:
+                cached = redis_client.get(key)
+            except redis.RedisError as e:
+                print(f"An error occurred while reading from the cache: {e}")
+                cached = None
+            if cached is not None:
+                return orjson.loads(cached)
+
+            result = func(value)
+            if result is not None:
+                try:
+                    redis_client.setex(key, ttl, orjson.dumps(result))
+                except redis.RedisError as e:
+                    print(f"An error occurred while writing to the cache: {e}")
+            return result
+
+        return wrapper
+
+    return decorator
@@ -4,5 +4,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY")
+FIRECRAWL_API_URL = os.getenv("FIRECRAWL_API_URL", "https://api.firecrawl.dev")
 DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
\ No newline at end of file
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# Fall back to rendering LinkedIn pages in headless Chrome instead of the guest HTTP endpoint
+LINKEDIN_USE_SELENIUM = os.getenv("LINKEDIN_USE_SELENIUM", "false").lower() == "true"
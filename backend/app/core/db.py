@@ -1,5 +1,6 @@
 import os
 
+import orjson
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
@@ -7,8 +8,23 @@ from sqlalchemy.orm import sessionmaker
 
 load_dotenv()
 
-engine = create_engine(os.getenv("SQLALCHEMY_DATABASE_URL"))
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(
+    os.getenv("SQLALCHEMY_DATABASE_URL"),
+    # Sized so concurrent requests don't queue on connection checkout
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    # psycopg2 fast execution helpers for executemany: VALUES for INSERTs, execute_batch otherwise
+    executemany_mode="values_plus_batch",
+    # Keep multi-row INSERT ... RETURNING batches well below Postgres' bind-parameter limit
+    insertmanyvalues_page_size=1000,
+    # orjson on both sides of JSON/JSONB columns; the psycopg2 dialect registers the deserializer
+    # as the driver's json/jsonb typecaster on connect
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
 
@@ -1,42 +1,96 @@
 # app/crud/jobs.py
-from pydantic import HttpUrl
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, defer
 from app import models, schemas
+# Load the submodules used below as models.job / schemas.job; the Celery worker imports
+# this module without going through the API routers that would otherwise load them
+import app.models.job  # noqa: F401
+import app.schemas.job  # noqa: F401
 
 
 def get_job(db: Session, job_id: int):
-    return db.query(models.job.Job).filter(models.job.Job.id == job_id).first()
+    return db.get(models.job.Job, job_id)
 
 
-def get_jobs(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.job.Job).offset(skip).limit(limit).all()
+def get_jobs(db: Session, after_id: Optional[int] = None, limit: int = 100):
+    """
+    Returns jobs newest-first using keyset pagination: pass the last id of the
+    previous page as `after_id` to fetch the next one.
+    """
+    # The description and analysis blobs are not part of the list view; skip loading them
+    query = (
+        db.query(models.job.Job)
+        .options(defer(models.job.Job.job_description), defer(models.job.Job.analysis_results))
+        .order_by(models.job.Job.id.desc())
+    )
+    if after_id is not None:
+        query = query.filter(models.job.Job.id < after_id)
+    return query.limit(limit).all()
 
 
 def create_job(db: Session, job: schemas.job.JobCreate):
-    job_data = job.model_dump()
-
-    # Convert HttpUrl to string
-    if isinstance(job_data.get("job_url"), HttpUrl):
-        job_data["job_url"] = str(job_data["job_url"])
-
-    db_job = models.job.Job(**job_data)
+    db_job = models.job.Job(**job.model_dump())
     db.add(db_job)
     db.commit()
     db.refresh(db_job)
     return db_job
 
+
+def iter_jobs(db: Session, batch_size: int = 500):
+    """
+    Yields every job, fetching rows from a server-side cursor `batch_size` at a time.
+    """
+    stmt = (
+        select(models.job.Job)
+        .order_by(models.job.Job.id)
+        .execution_options(yield_per=batch_size)
+    )
+    return db.scalars(stmt)
+
+
+def get_job_by_url(db: Session, job_url: str):
+    return db.query(models.job.Job).filter(models.job.Job.job_url == job_url).first()
+
+
+def create_jobs(db: Session, jobs: List[Dict[str, Any]]):
+    """
+    Inserts many jobs in a single batched INSERT ... RETURNING statement.
+    Jobs whose job_url is already stored are skipped and not returned.
+    """
+    if not jobs:
+        return []
+
+    stmt = (
+        pg_insert(models.job.Job)
+        .on_conflict_do_nothing(index_elements=[models.job.Job.job_url])
+        .returning(models.job.Job)
+    )
+    result = db.execute(stmt, jobs)
+    created_jobs = result.scalars().all()
+    db.commit()
+    return created_jobs
+
+
 def update_job(db: Session, job_id: int, job_update: schemas.job.JobUpdate):
-    db_job = get_job(db, job_id)
+    update_data = job_update.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_job(db, job_id)
+
+    # A single UPDATE ... RETURNING instead of SELECT, UPDATE, then a refresh SELECT
+    stmt = (
+        update(models.job.Job)
+        .where(models.job.Job.id == job_id)
+        .values(**update_data)
+        .returning(models.job.Job)
+    )
+    db_job = db.execute(stmt).scalar_one_or_none()
     if not db_job:
         return None
 
-    update_data = job_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_job, key, value)
-
-    db.add(db_job)
     db.commit()
-    db.refresh(db_job)
     return db_job
 
 
@@ -1,8 +1,10 @@
 # app/main.py
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.routers import jobs
 
 app = FastAPI(
+    default_response_class=ORJSONResponse,
     title="AI Job Co-pilot API",
     description="API for managing job applications and AI-powered analysis.",
     version="0.1.0"
@@ -1,6 +1,7 @@
 # app/models/job.py
 import enum
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
 from app.core.db import Base
@@ -18,11 +19,31 @@ class Job(Base):
     __tablename__ = "jobs"
 
     id = Column(Integer, primary_key=True, index=True)
-    job_title = Column(String, index=True)
-    company_name = Column(String, index=True)
+    job_title = Column(String)
+    company_name = Column(String)
     job_url = Column(String, unique=True, index=True)
     job_description = Column(Text)
-    analysis_results = Column(JSON)  # To store skills, tone, etc. from the LLM
-    status = Column(Enum(ApplicationStatus), default=ApplicationStatus.SAVED)
+    analysis_results = Column(JSONB(none_as_null=True))  # To store skills, tone, etc. from the LLM
+    status = Column(
+        Enum(
+            ApplicationStatus,
+            name="application_status",
+            native_enum=True,
+            values_callable=lambda statuses: [member.value for member in statuses],  # Store "saved", not "SAVED"
+        ),
+        default=ApplicationStatus.SAVED,
+        nullable=False,
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        # Serves the pipeline-tracker view: jobs in a given status, newest first
+        Index("ix_jobs_status_created", status, created_at.desc()),
+        # Most views only list jobs still in progress; a partial index over them stays small
+        Index(
+            "ix_jobs_status_active",
+            created_at.desc(),
+            postgresql_where=text("status IN ('saved', 'applied', 'interviewing')"),
+        ),
+    )
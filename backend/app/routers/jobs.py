@@ -1,11 +1,14 @@
 # app/routers/jobs.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from celery.result import AsyncResult
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, HttpUrl
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import Optional
 
-from app.schemas.job import Job, JobCreate, JobUpdate
+from app.celery_worker import celery_app
+from app.schemas.job import Job, JobCreate, JobPage, JobUpdate, ScrapeTask, ScrapeTaskStatus
 from app.schemas.linkedin_job import (
     LinkedInJobSearchRequest, 
     LinkedInJobSearchResponse, 
@@ -14,10 +17,9 @@ from app.schemas.linkedin_job import (
     LinkedInJobResult,
     LinkedInJobDetails
 )
-from app.core.db import get_db
-from app.services import scraper_service, llm_service
-from app.services.linkedin_scraper_service import search_linkedin_jobs, get_linkedin_job_details
-from app.crud.jobs import create_job, get_job, get_jobs, update_job, delete_job
+from app.core.db import SessionLocal, get_db
+from app.services.jobs.tasks import scrape_and_create
+from app.crud.jobs import create_job, get_job, get_jobs, iter_jobs, update_job, delete_job
 
 class ScrapeRequest(BaseModel):
     job_url: HttpUrl
@@ -37,10 +39,32 @@ def create_new_job(job: JobCreate, db: Session = Depends(get_db)):
     return create_job(db=db, job=job)
 
 
-@router.get("/", response_model=List[Job])
-def read_all_jobs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    jobs = get_jobs(db, skip=skip, limit=limit)
-    return jobs
+@router.get("/", response_model=JobPage)
+def read_all_jobs(
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    jobs = get_jobs(db, after_id=after_id, limit=limit)
+    next_cursor = jobs[-1].id if jobs and len(jobs) == limit else None
+    return {"items": jobs, "next_cursor": next_cursor}
+
+
+@router.get("/export")
+def export_jobs():
+    """
+    Streams every job, full description and analysis included, as newline-delimited JSON.
+    """
+    def generate():
+        # The request-scoped session is closed before the body is streamed, so use a dedicated one
+        db = SessionLocal()
+        try:
+            for db_job in iter_jobs(db):
+                yield Job.model_validate(db_job).model_dump_json() + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/{job_id}", response_model=Job)
@@ -75,6 +99,9 @@ def search_linkedin_jobs_endpoint(request: LinkedInJobSearchRequest):
     This endpoint scrapes LinkedIn job listings based on the provided search criteria.
     Results include job title, company, location, posting date, and job URLs.
     """
+    # Imported here so the Selenium/webdriver stack only loads once a LinkedIn endpoint is used
+    from app.services.linkedin_scraper_service import search_linkedin_jobs
+
     try:
         # Call the LinkedIn scraping service
         jobs_data = search_linkedin_jobs(
@@ -85,19 +112,8 @@ def search_linkedin_jobs_endpoint(request: LinkedInJobSearchRequest):
             job_type=request.job_type or ""
         )
         
-        # Convert to Pydantic models
-        job_results = []
-        for job_data in jobs_data:
-            if job_data:  # Skip any None results
-                job_result = LinkedInJobResult(
-                    title=job_data.get("title", "N/A"),
-                    company=job_data.get("company", "N/A"),
-                    location=job_data.get("location", "N/A"),
-                    posted_date=job_data.get("posted_date", "N/A"),
-                    job_url=job_data.get("job_url", ""),
-                    description_preview=job_data.get("description_preview", "")
-                )
-                job_results.append(job_result)
+        # Convert to Pydantic models, skipping any None results; missing fields take the schema defaults
+        job_results = [LinkedInJobResult.model_validate(job_data) for job_data in jobs_data if job_data]
         
         # Prepare search parameters for response
         search_params = {
@@ -139,19 +155,15 @@ def get_linkedin_job_details_endpoint(request: LinkedInJobDetailsRequest):
     This endpoint scrapes detailed job information including the full job description
     from a LinkedIn job posting URL.
     """
+    from app.services.linkedin_scraper_service import get_linkedin_job_details
+
     try:
         # Call the LinkedIn job details service
         job_details_data = get_linkedin_job_details(str(request.job_url))
         
         if job_details_data:
-            # Convert to Pydantic model
-            job_details = LinkedInJobDetails(
-                title=job_details_data.get("title", "N/A"),
-                company=job_details_data.get("company", "N/A"),
-                location=job_details_data.get("location", "N/A"),
-                description=job_details_data.get("description", "N/A"),
-                job_url=job_details_data.get("job_url", str(request.job_url))
-            )
+            # Convert to Pydantic model, falling back to the requested URL for job_url
+            job_details = LinkedInJobDetails.model_validate({"job_url": str(request.job_url), **job_details_data})
             
             response = LinkedInJobDetailsResponse(
                 job_details=job_details,
@@ -177,48 +189,26 @@ def get_linkedin_job_details_endpoint(request: LinkedInJobDetailsRequest):
         return error_response
 
 
-@router.post("/scrape", response_model=Job, status_code=status.HTTP_201_CREATED)
-def scrape_analyze_and_create_job(request: ScrapeRequest, db: Session = Depends(get_db)):
+@router.post("/scrape", response_model=ScrapeTask, status_code=status.HTTP_202_ACCEPTED)
+def scrape_analyze_and_create_job(request: ScrapeRequest):
     """
-    Scrapes a job URL, analyzes it with an LLM, and creates a job entry.
+    Queues a job URL to be scraped, analyzed with an LLM, and saved as a job entry.
+
+    The work runs on the Celery `jobs` queue; poll `GET /jobs/tasks/{task_id}` for the outcome.
     """
-    # Step 1: Scrape the content
-    scraped_content = scraper_service.scrape_job_url(str(request.job_url))
-    if not scraped_content:
-        raise HTTPException(status_code=500, detail="Failed to scrape URL.")
-
-    # Step 2: Analyze the content with the LLM
-    analysis_results = llm_service.analyze_job_description(scraped_content)
-    print("Gemini analysis results:", analysis_results)
-    print("Type:", type(analysis_results))
-    if not analysis_results:
-        raise HTTPException(status_code=500, detail="Failed to analyze job description.")
-    # Handle cases where analysis_results might be a list
-    if isinstance(analysis_results, list):
-        if analysis_results:
-            # If it's a list, take the first element as the primary analysis
-            # This assumes that even if multiple are returned, the first is the most relevant
-            final_analysis: Dict[str, Any] = analysis_results[0]
-        else:
-            raise HTTPException(status_code=500, detail="LLM analysis returned an empty list.")
-    elif isinstance(analysis_results, dict):
-        # If it's already a dictionary, use it directly
-        final_analysis: Dict[str, Any] = analysis_results
-    else:
-        raise HTTPException(status_code=500, detail="LLM analysis returned an unexpected type.")
-
-    # Step 3: Create the job entry using data from the analysis
-    new_job_data = JobCreate(
-        job_title=analysis_results.get("job_title", "Title not found"),
-        company_name=analysis_results.get("company_name", "Company not found"),
-        job_url=request.job_url,
-    )
-    db_job = create_job(db, job=new_job_data)
+    task = scrape_and_create.delay(str(request.job_url))
+    return ScrapeTask(task_id=task.id)
 
-    # Step 4: Add the full description and analysis JSON to the record
-    db_job.job_description = scraped_content
-    db_job.analysis_results = analysis_results
-    db.commit()
-    db.refresh(db_job)
 
-    return db_job
+@router.get("/tasks/{task_id}", response_model=ScrapeTaskStatus)
+def read_scrape_task(task_id: str):
+    """
+    Reports the state of a queued scrape task and, once it succeeds, the created job.
+    """
+    result = AsyncResult(task_id, app=celery_app)
+    return ScrapeTaskStatus(
+        task_id=task_id,
+        state=result.state,
+        job=result.result if result.successful() else None,
+        error=str(result.result) if result.failed() else None
+    )
@@ -1,6 +1,6 @@
 # app/schemas/job.py
-from pydantic import BaseModel, HttpUrl
-from typing import Optional, Any
+from pydantic import BaseModel, HttpUrl, field_serializer
+from typing import List, Optional, Any
 from datetime import datetime
 from app.models.job import ApplicationStatus
 
@@ -10,23 +10,47 @@ class JobBase(BaseModel):
     company_name: str
     job_url: HttpUrl
 
+    @field_serializer("job_url")
+    def serialize_job_url(self, job_url: HttpUrl) -> str:
+        # Dumped data goes straight into the String column, so emit a plain str
+        return str(job_url)
+
 
 class JobCreate(JobBase):
     pass
 
 
-class Job(JobBase):
+class JobSummary(JobBase):
     id: int
     status: ApplicationStatus
     created_at: datetime
-    job_description: Optional[str] = None
-    analysis_results: Optional[dict] = None
 
     class Config:
         from_attributes = True  # Pydantic v2
 
 
+class Job(JobSummary):
+    job_description: Optional[str] = None
+    analysis_results: Optional[dict] = None
+
+
+class JobPage(BaseModel):
+    items: List[JobSummary]
+    next_cursor: Optional[int] = None  # Pass as `after_id` to fetch the next page
+
+
 class JobUpdate(BaseModel):
     job_title: Optional[str] = None
     company_name: Optional[str] = None
-    status: Optional[ApplicationStatus] = None
+    # Omit to leave the status unchanged; an explicit null is rejected since the column is NOT NULL
+    status: ApplicationStatus = None
+
+
+class ScrapeTask(BaseModel):
+    task_id: str
+
+
+class ScrapeTaskStatus(ScrapeTask):
+    state: str
+    job: Optional[Job] = None
+    error: Optional[str] = None
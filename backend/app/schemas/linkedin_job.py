@@ -16,12 +16,12 @@ class LinkedInJobSearchRequest(BaseModel):
 
 class LinkedInJobResult(BaseModel):
     """Individual LinkedIn job result"""
-    title: str = Field(..., description="Job title")
-    company: str = Field(..., description="Company name")
-    location: str = Field(..., description="Job location")
-    posted_date: str = Field(..., description="Date when job was posted")
-    job_url: str = Field(..., description="LinkedIn job posting URL")
-    description_preview: Optional[str] = Field(None, description="Brief job description preview")
+    title: str = Field("N/A", description="Job title")
+    company: str = Field("N/A", description="Company name")
+    location: str = Field("N/A", description="Job location")
+    posted_date: str = Field("N/A", description="Date when job was posted")
+    job_url: str = Field("", description="LinkedIn job posting URL")
+    description_preview: Optional[str] = Field("", description="Brief job description preview")
 
 
 class LinkedInJobSearchResponse(BaseModel):
@@ -40,10 +40,10 @@ class LinkedInJobDetailsRequest(BaseModel):
 
 class LinkedInJobDetails(BaseModel):
     """Detailed LinkedIn job information"""
-    title: str = Field(..., description="Job title")
-    company: str = Field(..., description="Company name")
-    location: str = Field(..., description="Job location")
-    description: str = Field(..., description="Full job description")
+    title: str = Field("N/A", description="Job title")
+    company: str = Field("N/A", description="Company name")
+    location: str = Field("N/A", description="Job location")
+    description: str = Field("N/A", description="Full job description")
     job_url: str = Field(..., description="LinkedIn job posting URL")
 
 
@@ -0,0 +1,47 @@
+# app/services/jobs/tasks.py
+
+import logging
+
+from app.celery_worker import celery_app
+from app.core.db import SessionLocal
+from app.crud.jobs import create_jobs, get_job_by_url
+from app.schemas.job import Job
+from app.services import scraper_service, llm_service
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="app.services.jobs.scrape_and_create")
+def scrape_and_create(job_url: str):
+    """
+    Scrapes a job URL, analyzes it with an LLM, and creates a job entry.
+    Returns the created job as JSON-serializable data.
+    """
+    # Step 1: Scrape the content
+    scraped_content = scraper_service.scrape_job_url(job_url)
+    if not scraped_content:
+        raise RuntimeError("Failed to scrape URL.")
+
+    # Step 2: Analyze the content with the LLM
+    # analyze_job_description returns the analysis dict, or None if the analysis failed
+    analysis_results = llm_service.analyze_job_description(scraped_content)
+    if not isinstance(analysis_results, dict):
+        raise RuntimeError("Failed to analyze job description.")
+    logger.debug("Gemini analysis keys: %s", list(analysis_results.keys()))
+
+    db = SessionLocal()
+    try:
+        # Step 3: Create the full job entry, description and analysis JSON included, in one insert.
+        # A URL that is already stored is left untouched and the existing entry is returned.
+        created_jobs = create_jobs(db, [{
+            "job_title": analysis_results.get("job_title", "Title not found"),
+            "company_name": analysis_results.get("company_name", "Company not found"),
+            "job_url": job_url,
+            "job_description": scraped_content,
+            "analysis_results": analysis_results,
+        }])
+        db_job = created_jobs[0] if created_jobs else get_job_by_url(db, job_url)
+
+        return Job.model_validate(db_job).model_dump(mode="json")
+    finally:
+        db.close()
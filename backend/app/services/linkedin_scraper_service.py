@@ -1,7 +1,11 @@
 # app/services/linkedin_scraper_service.py
 
+import atexit
+import functools
+import threading
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -9,17 +13,69 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from html import unescape
+import orjson
 import requests
 from urllib.parse import urlencode, quote
 
+from app.core.config import LINKEDIN_USE_SELENIUM
+
+# Rotated per request so consecutive guest API calls don't all carry the same fingerprint
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
+]
+
+# Concurrent guest API page fetches per search, and the delay between their start times
+MAX_SEARCH_WORKERS = 8
+SEARCH_WORKER_STAGGER = 0.1
+# Cards on a full guest API page; a shorter first page means there are no further pages
+GUEST_PAGE_SIZE = 10
+
+# Resources the Selenium fallback never needs for text scraping
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp",
+    "*.css", "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics*", "*doubleclick*"
+]
+
+# Seconds an unused Chrome driver is kept alive before it is shut down
+DRIVER_IDLE_TIMEOUT = 300
+
+# Shared so guest API calls reuse pooled connections
+_session = requests.Session()
+_session.headers.update({"Accept-Language": "en-US,en;q=0.9"})
+
+
+@functools.lru_cache(maxsize=1)
+def _driver_path() -> str:
+    """Resolve (installing if needed) the ChromeDriver binary once per process"""
+    # Imported lazily: webdriver_manager is heavy and only the Selenium fallback needs it
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
 
 class LinkedInJobScraper:
-    def __init__(self):
+    def __init__(self, use_selenium: bool = LINKEDIN_USE_SELENIUM):
         self.base_url = "https://www.linkedin.com/jobs/search"
+        self.guest_search_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+        self.use_selenium = use_selenium
         self.driver = None
+        # A WebDriver session can't be shared between threads; serialize Selenium scrapes
+        self._driver_lock = threading.Lock()
+        self._idle_timer = None
+
+    def _fetch_html(self, url: str) -> str:
+        """Fetch a page over plain HTTP with a randomly picked User-Agent"""
+        response = _session.get(url, headers={"User-Agent": random.choice(USER_AGENTS)}, timeout=10)
+        response.raise_for_status()
+        return response.text
         
     def _setup_driver(self):
         """Setup Chrome driver with appropriate options for scraping"""
@@ -30,9 +86,22 @@ class LinkedInJobScraper:
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+        # Only the HTML is scraped, so skip images and other features that cost load time
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-features=Translate,BackForwardCache")
+        # Return from driver.get() once the DOM is ready instead of waiting for every subresource
+        chrome_options.page_load_strategy = "eager"
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
         
-        service = Service(ChromeDriverManager().install())
+        service = Service(_driver_path())
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
+
+        # Block the remaining heavy or irrelevant requests (stylesheets, fonts, trackers) at the network layer
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
         return self.driver
     
     def _close_driver(self):
@@ -40,14 +109,60 @@ class LinkedInJobScraper:
         if self.driver:
             self.driver.quit()
             self.driver = None
+
+    def _ensure_driver(self):
+        """Reuse the running Chrome driver, starting a new one if there is none or it has died"""
+        if self._idle_timer:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+        if self.driver:
+            try:
+                self.driver.current_url  # Cheap liveness check
+            except WebDriverException:
+                # Quit anyway so a hung browser or the chromedriver process isn't leaked
+                try:
+                    self.driver.quit()
+                except WebDriverException:
+                    pass
+                self.driver = None
+
+        if not self.driver:
+            self._setup_driver()
+        return self.driver
+
+    def _schedule_idle_shutdown(self):
+        """Quit the driver if nothing uses it for DRIVER_IDLE_TIMEOUT seconds"""
+        self._idle_timer = threading.Timer(DRIVER_IDLE_TIMEOUT, self._close_idle_driver)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _close_idle_driver(self):
+        """Idle timer callback; skipped if the driver was picked up again meanwhile"""
+        with self._driver_lock:
+            if self._idle_timer is threading.current_thread():
+                self._idle_timer = None
+                self._close_driver()
     
+    def _fetch_job_cards(self, search_url: str, delay: float = 0.0) -> list:
+        """Fetch one page of guest search results and return its job cards"""
+        time.sleep(delay)
+        print(f"Searching LinkedIn jobs with URL: {search_url}")
+        try:
+            return BeautifulSoup(self._fetch_html(search_url), "lxml").select(".base-card")
+        except requests.RequestException as e:
+            print(f"Error fetching LinkedIn search page: {e}")
+            return []
+
     def _build_search_url(self, keywords: str, location: str = "", experience_level: str = "", 
-                         job_type: str = "", sort_by: str = "date") -> str:
+                         job_type: str = "", sort_by: str = "date", base_url: str = "",
+                         start: int = 0) -> str:
         """Build LinkedIn job search URL with parameters"""
         params = {
             'keywords': keywords,
             'location': location,
-            'sortBy': sort_by
+            'sortBy': sort_by,
+            'start': start
         }
         
         # Add experience level filter
@@ -79,46 +194,74 @@ class LinkedInJobScraper:
         # Remove empty parameters
         params = {k: v for k, v in params.items() if v}
         
-        return f"{self.base_url}?{urlencode(params)}"
-    
-    def _extract_job_details(self, job_element) -> Dict[str, Any]:
-        """Extract job details from a job listing element"""
-        try:
-            # Job title
-            title_element = job_element.find_element(By.CSS_SELECTOR, "h3.base-search-card__title a")
-            title = title_element.text.strip() if title_element else "N/A"
-            job_url = title_element.get_attribute("href") if title_element else ""
-            
-            # Company name
-            company_element = job_element.find_element(By.CSS_SELECTOR, "h4.base-search-card__subtitle a")
-            company = company_element.text.strip() if company_element else "N/A"
-            
-            # Location
-            location_element = job_element.find_element(By.CSS_SELECTOR, "span.job-search-card__location")
-            location = location_element.text.strip() if location_element else "N/A"
-            
-            # Date posted
-            time_element = job_element.find_element(By.CSS_SELECTOR, "time.job-search-card__listdate")
-            posted_date = time_element.get_attribute("datetime") if time_element else "N/A"
-            
-            # Job description preview (if available)
+        return f"{base_url or self.base_url}?{urlencode(params)}"
+
+    def _parse_job_card(self, card) -> Optional[Dict[str, Any]]:
+        """Extract job details from a job card parsed with BeautifulSoup"""
+        title_element = card.select_one("h3.base-search-card__title")
+        if not title_element:
+            return None
+
+        link_element = card.select_one("a.base-card__full-link") or title_element.find("a")
+        company_element = card.select_one("h4.base-search-card__subtitle")
+        location_element = card.select_one("span.job-search-card__location")
+        time_element = card.select_one("time")
+        desc_element = card.select_one("p.job-search-card__snippet")
+
+        return {
+            "title": title_element.get_text(strip=True),
+            "company": company_element.get_text(strip=True) if company_element else "N/A",
+            "location": location_element.get_text(strip=True) if location_element else "N/A",
+            "posted_date": time_element.get("datetime", "N/A") if time_element else "N/A",
+            # Drop per-result tracking parameters so the same posting always has the same URL
+            "job_url": link_element.get("href", "").split("?")[0] if link_element else "",
+            "description_preview": desc_element.get_text(strip=True) if desc_element else ""
+        }
+
+    def _find_job_posting(self, soup) -> Optional[Dict[str, Any]]:
+        """Return the schema.org JobPosting LinkedIn embeds as JSON-LD, if the page has one"""
+        for script in soup.select('script[type="application/ld+json"]'):
             try:
-                desc_element = job_element.find_element(By.CSS_SELECTOR, "p.job-search-card__snippet")
-                description_preview = desc_element.text.strip() if desc_element else ""
-            except NoSuchElementException:
-                description_preview = ""
-            
+                # script.string is a bs4 Script (a str subclass), which orjson rejects; pass a plain str
+                data = orjson.loads(str(script.string or ""))
+            except orjson.JSONDecodeError:
+                continue
+            if isinstance(data, dict) and data.get("@type") == "JobPosting":
+                return data
+        return None
+
+    def _parse_job_details(self, html: str, job_url: str) -> Dict[str, Any]:
+        """Extract detailed job information from a job posting page"""
+        soup = BeautifulSoup(html, "lxml")
+
+        # Prefer the structured JobPosting data; it survives UI redesigns that break CSS selectors
+        posting = self._find_job_posting(soup)
+        if posting:
+            job_location = posting.get("jobLocation") or {}
+            if isinstance(job_location, list):
+                job_location = job_location[0] if job_location else {}
+            # The description is (often entity-escaped) HTML
+            description = BeautifulSoup(unescape(posting.get("description") or ""), "lxml")
+
             return {
-                "title": title,
-                "company": company,
-                "location": location,
-                "posted_date": posted_date,
-                "job_url": job_url,
-                "description_preview": description_preview
+                "title": posting.get("title") or "N/A",
+                "company": (posting.get("hiringOrganization") or {}).get("name") or "N/A",
+                "location": (job_location.get("address") or {}).get("addressLocality") or "N/A",
+                "description": description.get_text("\n", strip=True) or "N/A",
+                "job_url": job_url
             }
-        except Exception as e:
-            print(f"Error extracting job details: {e}")
-            return None
+
+        def _text(selector: str, separator: str = "") -> str:
+            element = soup.select_one(selector)
+            return element.get_text(separator, strip=True) if element else "N/A"
+
+        return {
+            "title": _text("h1.top-card-layout__title"),
+            "company": _text("a.topcard__org-name-link"),
+            "location": _text("span.topcard__flavor--bullet"),
+            "description": _text("div.show-more-less-html__markup", separator="\n"),
+            "job_url": job_url
+        }
     
     def search_jobs(self, keywords: str, location: str = "", max_results: int = 25,
                    experience_level: str = "", job_type: str = "") -> List[Dict[str, Any]]:
@@ -135,11 +278,57 @@ class LinkedInJobScraper:
         Returns:
             List of job dictionaries containing job details
         """
+        if self.use_selenium:
+            with self._driver_lock:
+                return self._search_jobs_selenium(keywords, location, max_results, experience_level, job_type)
+
+        jobs = []
+
+        try:
+            # The guest endpoint returns static HTML job cards, one page per `start` offset
+            build_url = functools.partial(self._build_search_url, keywords, location, experience_level,
+                                          job_type, base_url=self.guest_search_url)
+
+            # The first page tells us how many cards the endpoint serves per request
+            pages = [self._fetch_job_cards(build_url(start=0))]
+            page_size = len(pages[0])
+            # A short (or empty) first page already holds every match, so don't fan out
+            offsets = list(range(page_size, max_results, page_size)) if page_size >= GUEST_PAGE_SIZE else []
+
+            if offsets:
+                # Fetch the remaining pages concurrently, staggering worker start times
+                with ThreadPoolExecutor(max_workers=min(MAX_SEARCH_WORKERS, len(offsets))) as executor:
+                    futures = [
+                        executor.submit(self._fetch_job_cards, build_url(start=start), i * SEARCH_WORKER_STAGGER)
+                        for i, start in enumerate(offsets)
+                    ]
+                    pages.extend(future.result() for future in futures)
+
+            # Result pages can overlap, so the same posting may show up twice; keep its first occurrence
+            seen_urls = set()
+            for cards in pages:
+                for card in cards:
+                    job_details = self._parse_job_card(card)
+                    if not job_details or job_details["job_url"] in seen_urls:
+                        continue
+                    if job_details["job_url"]:
+                        seen_urls.add(job_details["job_url"])
+                    jobs.append(job_details)
+
+            print(f"Found {len(jobs)} job listings")
+        except Exception as e:
+            print(f"Error during LinkedIn job scraping: {e}")
+
+        return jobs[:max_results]
+
+    def _search_jobs_selenium(self, keywords: str, location: str = "", max_results: int = 25,
+                              experience_level: str = "", job_type: str = "") -> List[Dict[str, Any]]:
+        """Search for jobs by rendering the LinkedIn search page in headless Chrome"""
         jobs = []
         
         try:
-            # Setup driver
-            self._setup_driver()
+            # Reuse (or start) the shared driver
+            self._ensure_driver()
             
             # Build search URL
             search_url = self._build_search_url(keywords, location, experience_level, job_type)
@@ -149,37 +338,31 @@ class LinkedInJobScraper:
             self.driver.get(search_url)
             
             # Wait for page to load
-            wait = WebDriverWait(self.driver, 10)
+            wait = WebDriverWait(self.driver, 5)
             wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "ul.jobs-search__results-list")))
             
             # Add random delay to avoid being detected
             time.sleep(random.uniform(2, 4))
             
-            # Find job listings
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, "li.result-card.job-result-card")
-            
-            if not job_elements:
-                # Try alternative selector
-                job_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.base-card.relative")
+            # Read the rendered page once and parse it locally, rather than querying
+            # every field of every card over the WebDriver protocol
+            job_cards = BeautifulSoup(self.driver.page_source, "lxml").select(".base-card")
             
-            print(f"Found {len(job_elements)} job listings")
+            print(f"Found {len(job_cards)} job listings")
             
             # Extract job details
-            for i, job_element in enumerate(job_elements[:max_results]):
-                job_details = self._extract_job_details(job_element)
+            for i, job_card in enumerate(job_cards[:max_results]):
+                job_details = self._parse_job_card(job_card)
                 if job_details:
                     jobs.append(job_details)
                     print(f"Extracted job {i+1}: {job_details['title']} at {job_details['company']}")
-                
-                # Add small delay between extractions
-                time.sleep(random.uniform(0.5, 1.5))
             
         except TimeoutException:
             print("Timeout waiting for LinkedIn page to load")
         except Exception as e:
             print(f"Error during LinkedIn job scraping: {e}")
         finally:
-            self._close_driver()
+            self._schedule_idle_shutdown()
         
         return jobs
     
@@ -193,56 +376,45 @@ class LinkedInJobScraper:
         Returns:
             Dictionary containing detailed job information
         """
+        if self.use_selenium:
+            with self._driver_lock:
+                return self._get_job_details_selenium(job_url)
+
         try:
-            self._setup_driver()
+            return self._parse_job_details(self._fetch_html(job_url), job_url)
+        except Exception as e:
+            print(f"Error getting job details: {e}")
+            return None
+
+    def _get_job_details_selenium(self, job_url: str) -> Optional[Dict[str, Any]]:
+        """Get detailed job information by rendering the job page in headless Chrome"""
+        try:
+            self._ensure_driver()
             
             # Navigate to job page
             self.driver.get(job_url)
             
             # Wait for page to load
-            wait = WebDriverWait(self.driver, 10)
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.show-more-less-html__markup")))
-            
-            # Extract job details
-            job_details = {}
+            wait = WebDriverWait(self.driver, 5, poll_frequency=0.1)
+            wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, "div.show-more-less-html__markup")))
             
-            # Job title
-            try:
-                title_element = self.driver.find_element(By.CSS_SELECTOR, "h1.top-card-layout__title")
-                job_details["title"] = title_element.text.strip()
-            except NoSuchElementException:
-                job_details["title"] = "N/A"
-            
-            # Company name
-            try:
-                company_element = self.driver.find_element(By.CSS_SELECTOR, "a.topcard__org-name-link")
-                job_details["company"] = company_element.text.strip()
-            except NoSuchElementException:
-                job_details["company"] = "N/A"
-            
-            # Location
-            try:
-                location_element = self.driver.find_element(By.CSS_SELECTOR, "span.topcard__flavor--bullet")
-                job_details["location"] = location_element.text.strip()
-            except NoSuchElementException:
-                job_details["location"] = "N/A"
-            
-            # Job description
-            try:
-                desc_element = self.driver.find_element(By.CSS_SELECTOR, "div.show-more-less-html__markup")
-                job_details["description"] = desc_element.text.strip()
-            except NoSuchElementException:
-                job_details["description"] = "N/A"
-            
-            job_details["job_url"] = job_url
-            
-            return job_details
+            # Read the rendered page once instead of querying each field over WebDriver
+            return self._parse_job_details(self.driver.page_source, job_url)
             
         except Exception as e:
             print(f"Error getting job details: {e}")
             return None
         finally:
-            self._close_driver()
+            self._schedule_idle_shutdown()
+
+
+# Shared by the service functions so the Chrome driver (when used) outlives a single request
+_scraper = LinkedInJobScraper()
+atexit.register(_scraper._close_driver)
+
+# Listings change on roughly hourly timescales, so repeat searches within 15 minutes reuse results
+_search_cache = TTLCache(maxsize=512, ttl=900)
+_search_cache_lock = threading.Lock()
 
 
 # Service functions for use in the API
@@ -261,8 +433,19 @@ def search_linkedin_jobs(keywords: str, location: str = "", max_results: int = 2
     Returns:
         List of job dictionaries
     """
-    scraper = LinkedInJobScraper()
-    return scraper.search_jobs(keywords, location, max_results, experience_level, job_type)
+    cache_key = (keywords.strip().lower(), location.strip().lower(), max_results,
+                 experience_level.lower(), job_type.lower())
+    with _search_cache_lock:
+        cached_jobs = _search_cache.get(cache_key)
+    if cached_jobs is not None:
+        return list(cached_jobs)
+
+    jobs = _scraper.search_jobs(keywords, location, max_results, experience_level, job_type)
+    # Empty results usually mean the scrape failed; don't pin that for the whole TTL
+    if jobs:
+        with _search_cache_lock:
+            _search_cache[cache_key] = jobs
+    return list(jobs)
 
 
 def get_linkedin_job_details(job_url: str) -> Optional[Dict[str, Any]]:
@@ -275,5 +458,4 @@ def get_linkedin_job_details(job_url: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionary containing job details
     """
-    scraper = LinkedInJobScraper()
-    return scraper.get_job_details(job_url)
\ No newline at end of file
+    return _scraper.get_job_details(job_url)
\ No newline at end of file
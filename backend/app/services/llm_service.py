@@ -1,52 +1,87 @@
 # app/services/llm_service.py
-import json
+import orjson
+from typing import List, Optional
+
+from typing_extensions import TypedDict
 
 from openai import OpenAI
 from app.core.config import DEEPSEEK_API_KEY  # <-- Import the new key
 from app.core.config import GEMINI_API_KEY
 import google.generativeai as genai
+from app.core.cache import redis_cache
 
 
-def analyze_job_description(description: str):
+class JobAnalysis(TypedDict):
+    """Structured output Gemini is constrained to when analyzing a job description."""
+    job_title: str
+    company_name: str
+    key_skills: List[str]
+    soft_skills: List[str]
+    experience_level: str
+
+
+# Configure the Gemini API once at import. Skipped without a key so the module
+# can still be imported (and the model mocked) in environments without one.
+if GEMINI_API_KEY:
+    genai.configure(api_key=GEMINI_API_KEY)
+
+# Choose a Gemini model. 'gemini-pro' is a good general-purpose model for text.
+# You might consider 'gemini-1.5-pro' for more advanced use cases or longer contexts,
+# but ensure you have access to it and understand its pricing.
+_ANALYSIS_MODEL = genai.GenerativeModel(model_name="models/gemini-2.0-flash")
+
+
+def analyze_job_descriptions(descriptions: List[str]) -> Optional[List[dict]]:
     """
-    Analyzes job description using Gemini to extract key info.
+    Analyzes several job descriptions in a single Gemini call to extract key info.
+    Returns one result per description, in input order, or None if the analysis failed.
     """
     if not GEMINI_API_KEY:
         raise ValueError("Gemini API key is not set. Please set the 'GEMINI_API_KEY' environment variable.")
 
-    # Configure the Gemini API with your API key
-    genai.configure(api_key=GEMINI_API_KEY)
-
-    # Choose a Gemini model. 'gemini-pro' is a good general-purpose model for text.
-    # You might consider 'gemini-1.5-pro' for more advanced use cases or longer contexts,
-    # but ensure you have access to it and understand its pricing.
-    model = genai.GenerativeModel(model_name="models/gemini-2.0-flash")
+    if not descriptions:
+        return []
 
+    numbered_descriptions = "\n".join(
+        f"[{i}]\n---\n{description}\n---" for i, description in enumerate(descriptions, start=1)
+    )
     prompt = f"""
-    Analyze the following job description and extract key information.
-    Please return the output ONLY as a JSON object with the following keys:
+    Analyze each of the following {len(descriptions)} job descriptions and extract key information.
+    Please return the output ONLY as a JSON array containing exactly one object per description,
+    in the same order as the descriptions, each with the following keys:
     - "job_title": The official job title.
     - "company_name": The name of the company hiring.
     - "key_skills": A list of the top 5-7 most important technical skills (e.g., Python, React, SQL).
     - "soft_skills": A list of the top 3-5 most important soft skills (e.g., Communication, Teamwork).
     - "experience_level": The required experience level (e.g., "Entry-level", "Mid-level", "Senior", "3-5 years").
 
-    Job Description:
-    ---
-    {description}
-    ---
+    Job Descriptions:
+    {numbered_descriptions}
     """
 
     try:
-        response = model.generate_content(
+        response = _ANALYSIS_MODEL.generate_content(
             contents=[{"role": "user", "parts": [{"text": prompt}]}],
             generation_config=genai.types.GenerationConfig(
-                response_mime_type="application/json"  # This helps Gemini return JSON
+                response_mime_type="application/json",  # This helps Gemini return JSON
+                response_schema=list[JobAnalysis]  # Enforced server-side: an array of analysis objects
             )
         )
         # Gemini's response is in response.text, which should be a JSON string
-        analysis_result = json.loads(response.text)
-        return analysis_result
+        analysis_results = orjson.loads(response.text)
+        if len(analysis_results) != len(descriptions):
+            print(f"LLM analysis returned {len(analysis_results)} results for {len(descriptions)} descriptions")
+            return None
+        return analysis_results
     except Exception as e:
         print(f"An error occurred during LLM analysis: {e}")
         return None
+
+
+@redis_cache("analysis")
+def analyze_job_description(description: str):
+    """
+    Analyzes job description using Gemini to extract key info.
+    """
+    analysis_results = analyze_job_descriptions([description])
+    return analysis_results[0] if analysis_results else None
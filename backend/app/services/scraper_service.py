@@ -1,9 +1,21 @@
 # app/services/scraper_service.py
 
-from firecrawl import FirecrawlApp
-from app.core.config import FIRECRAWL_API_KEY
+import httpx
 
+from app.core.cache import redis_cache
+from app.core.config import FIRECRAWL_API_KEY, FIRECRAWL_API_URL
 
+# Shared across calls so scrapes reuse pooled HTTP/2 connections instead of
+# paying a fresh TCP/TLS handshake per URL
+_client = httpx.Client(
+    base_url=FIRECRAWL_API_URL,
+    http2=True,
+    timeout=60,
+    limits=httpx.Limits(max_connections=32),
+)
+
+
+@redis_cache("scrape")
 def scrape_job_url(url: str):
     """
     Scrapes a given URL using Firecrawl and returns the markdown content.
@@ -11,12 +23,15 @@ def scrape_job_url(url: str):
     if not FIRECRAWL_API_KEY:
         raise ValueError("Firecrawl API key is not set.")
 
-    app = FirecrawlApp(api_key=FIRECRAWL_API_KEY)
-
     try:
-        scraped_data = app.scrape_url(url)
+        response = _client.post(
+            "/v1/scrape",
+            headers={"Authorization": f"Bearer {FIRECRAWL_API_KEY}"},
+            json={"url": url, "formats": ["markdown"]},
+        )
+        response.raise_for_status()
         # We are interested in the markdown content for cleaner text
-        return scraped_data.markdown
+        return response.json()["data"]["markdown"]
     except Exception as e:
         print(f"An error occurred while scraping: {e}")
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,62 @@
+# tests/test_linkedin_scraper_service.py
+
+import pytest
+
+from app.services.linkedin_scraper_service import LinkedInJobScraper
+
+JOB_URL = "https://www.linkedin.com/jobs/view/python-developer-at-acme-1234567890"
+
+JOB_POSTING_PAGE = """
+<html>
+<head>
+<script type="application/ld+json">{"@context": "http://schema.org", "@type": "BreadcrumbList"}</script>
+<script type="application/ld+json">
+{
+    "@context": "http://schema.org",
+    "@type": "JobPosting",
+    "title": "Python Developer",
+    "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+    "jobLocation": {"@type": "Place", "address": {"addressLocality": "Paris", "addressCountry": "FR"}},
+    "description": "&lt;p&gt;Build APIs.&lt;/p&gt;&lt;ul&gt;&lt;li&gt;FastAPI&lt;/li&gt;&lt;/ul&gt;"
+}
+</script>
+</head>
+<body><h1 class="top-card-layout__title">Stale title</h1></body>
+</html>
+"""
+
+TOP_CARD_PAGE = """
+<html>
+<body>
+<h1 class="top-card-layout__title">Data Engineer</h1>
+<a class="topcard__org-name-link">Globex</a>
+<span class="topcard__flavor--bullet">Berlin</span>
+<div class="show-more-less-html__markup"><p>Own pipelines.</p><p>Write SQL.</p></div>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def scraper():
+    return LinkedInJobScraper(use_selenium=False)
+
+
+def test_parse_job_details_reads_json_ld_job_posting(scraper):
+    assert scraper._parse_job_details(JOB_POSTING_PAGE, JOB_URL) == {
+        "title": "Python Developer",
+        "company": "Acme",
+        "location": "Paris",
+        "description": "Build APIs.\nFastAPI",
+        "job_url": JOB_URL
+    }
+
+
+def test_parse_job_details_falls_back_to_top_card(scraper):
+    assert scraper._parse_job_details(TOP_CARD_PAGE, JOB_URL) == {
+        "title": "Data Engineer",
+        "company": "Globex",
+        "location": "Berlin",
+        "description": "Own pipelines.\nWrite SQL.",
+        "job_url": JOB_URL
+    }